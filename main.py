@@ -1,48 +1,98 @@
 import asyncio
 import http.server
-import socketserver
 import threading
 from pathlib import Path
-from playwright.async_api import async_playwright
-from playwright_utils.playwright_utils import wait_for_element
+from typing import Optional
+from playwright.async_api import async_playwright, Browser, Playwright
+from playwright_utils.async_utils import wait_for_element
 
 PORT = 8000
 
+# Started once and reused; each run gets its own context for isolation.
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+_browser_driver: Optional[Playwright] = None
+_server_thread: Optional[threading.Thread] = None
+
 class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep connections open so the browser can reuse them across asset requests
+    protocol_version = "HTTP/1.1"
+    # Serve files from the example_site directory
+    root = (Path(__file__).parent / "example_site").resolve()
+
     def translate_path(self, path):
-        # Serve files from the example_site directory
-        root = Path(__file__).parent / "example_site"
-        return str(root / path.lstrip("/"))
+        return str(self.root / path.lstrip("/"))
 
 def start_server():
     handler = CustomHTTPRequestHandler
-    with socketserver.TCPServer(("", PORT), handler) as httpd:
+    with http.server.ThreadingHTTPServer(("", PORT), handler) as httpd:
         print(f"Serving at port {PORT}")
         httpd.serve_forever()
 
-async def run(playwright):
-    browser = await playwright.chromium.launch(headless=False)
-    context = await browser.new_context()
-    page = await context.new_page()
+def ensure_server():
+    global _server_thread
+    if _server_thread is None:
+        _server_thread = threading.Thread(target=start_server)
+        _server_thread.daemon = True
+        _server_thread.start()
 
-    # Replace with the URL you want to test
-    await page.goto(f"http://localhost:{PORT}/index.html")
+async def get_playwright() -> Playwright:
+    global _playwright
+    if _playwright is None:
+        _playwright = await async_playwright().start()
+    return _playwright
 
-    # Use the utility function to wait for an element
-    selector = "#delayedElement"
-    element = await wait_for_element(page, selector)
-    print(f"Element text: {await element.inner_text()}")
+async def get_browser(playwright: Playwright) -> Browser:
+    global _browser, _browser_driver
+    # The cached browser belongs to the driver that launched it; relaunch for another one
+    if _browser is not None and (_browser_driver is not playwright or not _browser.is_connected()):
+        await close_browser()
+    if _browser is None:
+        _browser = await playwright.chromium.launch(headless=False)
+        _browser_driver = playwright
+    return _browser
 
-    # Close the browser
-    await browser.close()
+async def close_browser():
+    global _browser, _browser_driver
+    if _browser is not None:
+        if _browser.is_connected():
+            await _browser.close()
+        _browser = None
+        _browser_driver = None
 
-async def main():
-    server_thread = threading.Thread(target=start_server)
-    server_thread.daemon = True
-    server_thread.start()
+async def shutdown():
+    # Playwright.stop() must be awaited on the loop that started it, so callers
+    # that own the loop call this themselves instead of relying on atexit.
+    global _playwright
+    await close_browser()
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
 
-    async with async_playwright() as playwright:
-        await run(playwright)
+async def run_once(playwright: Optional[Playwright] = None):
+    # Usable from a loop the caller already owns; call shutdown() when done
+    ensure_server()
+    browser = await get_browser(playwright or await get_playwright())
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+
+        # Replace with the URL you want to test
+        await page.goto(f"http://localhost:{PORT}/index.html")
+
+        # Use the utility function to wait for an element
+        selector = "#delayedElement"
+        element = await wait_for_element(page, selector)
+        print(f"Element text: {await element.inner_text()}")
+    finally:
+        # Close the context only; the browser stays up for the next run
+        await context.close()
+
+async def main():
+    try:
+        await run_once()
+    finally:
+        await shutdown()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
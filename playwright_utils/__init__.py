@@ -9,6 +9,23 @@ from .playwright_utils import (
     send_keys_safely,
     get_element_text,
     get_element_attribute,
+    get_many,
     check_element_exist,
     scroll_to_bottom
-)
\ No newline at end of file
+)
+from . import async_utils
+
+__all__ = [
+    "wait_for_element",
+    "wait_for_all_elements",
+    "wait_for_element_to_be_clickable",
+    "wait_for_url_change",
+    "click_element_safely",
+    "send_keys_safely",
+    "get_element_text",
+    "get_element_attribute",
+    "get_many",
+    "check_element_exist",
+    "scroll_to_bottom",
+    "async_utils",
+]
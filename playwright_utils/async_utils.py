@@ -0,0 +1,92 @@
+# src/async_utils.py
+
+import asyncio
+import logging
+from typing import Callable, Optional, List, Tuple
+from playwright.async_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
+# Caches and page-side scripts are shared with the sync module; only the awaits differ
+from .playwright_utils import (
+    _loc,
+    _helpers_bound,
+    _PAGE_HELPERS,
+    _GET_MANY_SCRIPT,
+    _SET_VALUE_SCRIPT,
+)
+
+logger = logging.getLogger(__name__)
+
+async def _bind_page_helpers(page: Page) -> None:
+    if page in _helpers_bound:
+        return
+    await page.add_init_script(_PAGE_HELPERS)
+    _helpers_bound.add(page)
+    await page.evaluate(_PAGE_HELPERS)
+
+async def wait_for_element(page: Page, selector: str, timeout: int = 10000) -> Locator:
+    logger.debug("wait_for_element: %s", selector)
+    element = _loc(page, selector)
+    await element.wait_for(state="visible", timeout=timeout)
+    return element
+
+async def wait_for_all_elements(page: Page, selector: str, timeout: int = 10000) -> List[Locator]:
+    logger.debug("wait_for_all_elements: %s", selector)
+    elements = page.locator(selector)
+    await elements.first.wait_for(state="attached", timeout=timeout)
+    return await elements.all()
+
+async def wait_for_all(page: Page, selectors: List[str], timeout: int = 10000) -> List[Locator]:
+    logger.debug("wait_for_all: %s", selectors)
+    # All waits share the same connection, so their round-trips overlap
+    return await asyncio.gather(*(wait_for_element(page, selector, timeout) for selector in selectors))
+
+async def wait_for_element_to_be_clickable(page: Page, selector: str, timeout: int = 10000) -> Locator:
+    logger.debug("wait_for_element_to_be_clickable: %s", selector)
+    element = _loc(page, selector).and_(page.locator(":not([disabled])"))
+    await element.wait_for(state="visible", timeout=timeout)
+    return element
+
+async def wait_for_url_change(page: Page, url: str | Callable[[str], bool], timeout: int = 10000) -> None:
+    logger.debug("wait_for_url_change: %s", url)
+    await page.wait_for_url(url, wait_until="domcontentloaded", timeout=timeout)
+
+async def click_element_safely(page: Page, selector: str, timeout: int = 10000) -> None:
+    logger.debug("click_element_safely: %s", selector)
+    await _loc(page, selector).click(timeout=timeout)
+
+async def send_keys_safely(page: Page, selector_or_element: str | Locator, text: str, timeout: int = 10000, fast: bool = False) -> None:
+    logger.debug("send_keys_safely: %s, %s", selector_or_element, text)
+    element = _loc(page, selector_or_element) if isinstance(selector_or_element, str) else selector_or_element
+    if fast:
+        await element.evaluate(_SET_VALUE_SCRIPT, text, timeout=timeout)
+        return
+    await element.fill(text, timeout=timeout)
+
+async def get_element_text(page: Page, selector: str, timeout: int = 10000) -> Optional[str]:
+    logger.debug("get_element_text: %s", selector)
+    element = await wait_for_element(page, selector, timeout)
+    return (await element.inner_text()).strip()
+
+async def get_element_attribute(page: Page, selector: str, attribute: str, timeout: int = 10000) -> Optional[str]:
+    logger.debug("get_element_attribute: %s, %s", selector, attribute)
+    element = await wait_for_element(page, selector, timeout)
+    return await element.get_attribute(attribute)
+
+async def get_many(page: Page, requests: List[Tuple[str, Optional[str]]]) -> List[Optional[str]]:
+    """Async get_many; plain CSS selectors only, see playwright_utils.get_many."""
+    logger.debug("get_many: %s", requests)
+    return await page.evaluate(_GET_MANY_SCRIPT, requests)
+
+async def check_element_exist(page: Page, selector: str, timeout: int = 10000) -> bool:
+    logger.debug("check_element_exist: %s", selector)
+    element = _loc(page, selector)
+    if await element.count() == 0 or not await element.is_visible():
+        return False
+    try:
+        return await element.is_enabled(timeout=timeout)
+    except PlaywrightTimeoutError:
+        return False
+
+async def scroll_to_bottom(page: Page) -> None:
+    logger.debug("scroll_to_bottom")
+    await _bind_page_helpers(page)
+    await page.evaluate("__pwuScrollToBottom()")
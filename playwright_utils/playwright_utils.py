@@ -1,66 +1,141 @@
 # src/playwright_utils.py
 
 import logging
-from typing import Optional, List
-from playwright.sync_api import Page, Locator
+from collections import OrderedDict
+from typing import Callable, Optional, List, Tuple
+from weakref import WeakKeyDictionary, WeakSet
+from playwright.sync_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
 
 logger = logging.getLogger(__name__)
 
+_LOCATOR_CACHE_SIZE = 256
+_locator_cache: "WeakKeyDictionary[Page, OrderedDict[str, Locator]]" = WeakKeyDictionary()
+
+def _loc(page: Page, selector: str) -> Locator:
+    # Reuse one Locator per (page, selector) so repeated helpers on the same
+    # selector don't rebuild the query; each page keeps a small LRU.
+    # locator() and once() are synchronous in both APIs, so async_utils shares this.
+    cache = _locator_cache.get(page)
+    if cache is None:
+        cache = _locator_cache[page] = OrderedDict()
+        # Locators reference their page, so drop the entry explicitly on close.
+        page.once("close", lambda _: _locator_cache.pop(page, None))
+    element = cache.get(selector)
+    if element is None:
+        element = cache[selector] = page.locator(selector).first
+        if len(cache) > _LOCATOR_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(selector)
+    return element
+
+# Wrapped in an IIFE so evaluate() doesn't treat the bundle as a function to call
+_PAGE_HELPERS = """(() => {
+    window.__pwuScrollToBottom = () => window.scrollTo(0, document.body.scrollHeight);
+})();"""
+_helpers_bound: "WeakSet[Page]" = WeakSet()
+
+def _bind_page_helpers(page: Page) -> None:
+    # Install the JS helpers once per page: the init script covers later
+    # navigations, the evaluate covers the document that is already loaded.
+    if page in _helpers_bound:
+        return
+    page.add_init_script(_PAGE_HELPERS)
+    # Mark before evaluating: if a navigation destroys the context mid-evaluate,
+    # the new document still gets the init script and it must not be added twice.
+    _helpers_bound.add(page)
+    page.evaluate(_PAGE_HELPERS)
+
+_GET_MANY_SCRIPT = """(requests) => requests.map(([selector, attribute]) => {
+    const element = document.querySelector(selector);
+    if (!element) return null;
+    return attribute != null ? element.getAttribute(attribute) : element.innerText.trim();
+})"""
+
+_SET_VALUE_SCRIPT = """(element, value) => {
+    element.focus();
+    element.value = value;
+    element.dispatchEvent(new Event("input", { bubbles: true }));
+    element.dispatchEvent(new Event("change", { bubbles: true }));
+}"""
+
 def wait_for_element(page: Page, selector: str, timeout: int = 10000) -> Locator:
-    logger.debug(f"wait_for_element: {selector}")
-    return page.wait_for_selector(selector, timeout=timeout)
+    logger.debug("wait_for_element: %s", selector)
+    element = _loc(page, selector)
+    element.wait_for(state="visible", timeout=timeout)
+    return element
 
 def wait_for_all_elements(page: Page, selector: str, timeout: int = 10000) -> List[Locator]:
-    logger.debug(f"wait_for_all_elements: {selector}")
-    page.wait_for_selector(selector, timeout=timeout)
-    return page.query_selector_all(selector)
+    logger.debug("wait_for_all_elements: %s", selector)
+    elements = page.locator(selector)
+    elements.first.wait_for(state="attached", timeout=timeout)
+    return elements.all()
 
 def wait_for_element_to_be_clickable(page: Page, selector: str, timeout: int = 10000) -> Locator:
-    logger.debug(f"wait_for_element_to_be_clickable: {selector}")
-    element = wait_for_element(page, selector, timeout)
-    page.wait_for_function(
-        "element => element && element.offsetParent !== null && !element.disabled",
-        arg=element,
-        timeout=timeout
-    )
+    logger.debug("wait_for_element_to_be_clickable: %s", selector)
+    # Visible + not disabled is matched by the selector engine in one wait;
+    # stable/receives-events are checked by Playwright when the locator is acted on.
+    element = _loc(page, selector).and_(page.locator(":not([disabled])"))
+    element.wait_for(state="visible", timeout=timeout)
     return element
 
-def wait_for_url_change(page: Page, url: str, timeout: int = 10000) -> None:
-    logger.debug(f"wait_for_url_change: {url}")
-    page.wait_for_url(url, timeout=timeout)
-    page.wait_for_load_state("domcontentloaded")
+def wait_for_url_change(page: Page, url: str | Callable[[str], bool], timeout: int = 10000) -> None:
+    logger.debug("wait_for_url_change: %s", url)
+    # url is the destination (returns at once if already there) or a predicate,
+    # e.g. lambda u: u != start to wait for leaving a page.
+    # wait_until folds the domcontentloaded wait into the same navigation wait
+    page.wait_for_url(url, wait_until="domcontentloaded", timeout=timeout)
     
 def click_element_safely(page: Page, selector: str, timeout: int = 10000) -> None:
-    logger.debug(f"click_element_safely: {selector}")
-    element = wait_for_element_to_be_clickable(page, selector, timeout)
-    element.click()
-
-def send_keys_safely(page: Page, selector_or_element: str | Locator, text: str, timeout: int = 10000) -> None:
-    logger.debug(f"send_keys_safely: {selector_or_element}, {text}")
-    if isinstance(selector_or_element, str):
-        element = wait_for_element(page, selector_or_element, timeout)
-    else:
-        element = selector_or_element
-    element.fill(text)
+    logger.debug("click_element_safely: %s", selector)
+    _loc(page, selector).click(timeout=timeout)
+
+def send_keys_safely(page: Page, selector_or_element: str | Locator, text: str, timeout: int = 10000, fast: bool = False) -> None:
+    logger.debug("send_keys_safely: %s, %s", selector_or_element, text)
+    element = _loc(page, selector_or_element) if isinstance(selector_or_element, str) else selector_or_element
+    if fast:
+        # Set the value directly in one evaluate, skipping actionability checks;
+        # only input/change events fire, not per-key events
+        element.evaluate(_SET_VALUE_SCRIPT, text, timeout=timeout)
+        return
+    # fill() auto-waits for the input to be visible, enabled and editable
+    element.fill(text, timeout=timeout)
 
 def get_element_text(page: Page, selector: str, timeout: int = 10000) -> Optional[str]:
-    logger.debug(f"get_element_text: {selector}")
+    logger.debug("get_element_text: %s", selector)
     element = wait_for_element(page, selector, timeout)
-    return element.inner_text().strip() if element else None
+    return element.inner_text().strip()
 
 def get_element_attribute(page: Page, selector: str, attribute: str, timeout: int = 10000) -> Optional[str]:
-    logger.debug(f"get_element_attribute: {selector}, {attribute}")
+    logger.debug("get_element_attribute: %s, %s", selector, attribute)
     element = wait_for_element(page, selector, timeout)
-    return element.get_attribute(attribute) if element else None
+    return element.get_attribute(attribute)
+
+def get_many(page: Page, requests: List[Tuple[str, Optional[str]]]) -> List[Optional[str]]:
+    """Read several values in one round trip.
+
+    Each (selector, attribute) pair yields that attribute, or the stripped inner
+    text when attribute is None, or None when nothing matches. Nothing is waited for.
+
+    Selectors go to document.querySelector, so only plain CSS is supported:
+    Playwright selectors (text=, xpath=, >>) raise, and shadow DOM is not pierced.
+    """
+    logger.debug("get_many: %s", requests)
+    return page.evaluate(_GET_MANY_SCRIPT, requests)
 
 def check_element_exist(page: Page, selector: str, timeout: int = 10000) -> bool:
-    logger.debug(f"check_element_exist: {selector}")
+    logger.debug("check_element_exist: %s", selector)
+    # A single probe instead of a wait; timeout only bounds the is_enabled() call
+    element = _loc(page, selector)
+    if element.count() == 0 or not element.is_visible():
+        return False
     try:
-        wait_for_element_to_be_clickable(page, selector, timeout)
-        return True
-    except Exception:
+        # is_enabled() waits for the element, so bound it in case it detached after count()
+        return element.is_enabled(timeout=timeout)
+    except PlaywrightTimeoutError:
         return False
 
 def scroll_to_bottom(page: Page) -> None:
     logger.debug("scroll_to_bottom")
-    page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
+    _bind_page_helpers(page)
+    page.evaluate("__pwuScrollToBottom()")
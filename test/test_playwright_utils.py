@@ -1,32 +1,42 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import http.server
 import logging
+import mimetypes
 from pathlib import Path
-import socketserver
 import threading
-from typing import Generator
+from typing import Any, Coroutine, Dict, Generator
+from urllib.parse import urlparse
 import pytest
-from playwright.sync_api import Page, expect, sync_playwright, TimeoutError as PlaywrightTimeoutError, Browser
+from playwright.sync_api import Page, expect, sync_playwright, TimeoutError as PlaywrightTimeoutError, Browser, BrowserContext, Route
+from playwright.async_api import async_playwright
+from playwright_utils import async_utils
 from playwright_utils import (
     wait_for_element, wait_for_all_elements,
     wait_for_element_to_be_clickable, wait_for_url_change,
-    click_element_safely, send_keys_safely
+    click_element_safely, send_keys_safely, check_element_exist,
+    get_element_text, get_element_attribute, get_many, scroll_to_bottom
 )
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+PORT = 8000
+
 
 class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep connections open so the browser can reuse them across asset requests
+    protocol_version = "HTTP/1.1"
+    # Serve files from the example_site directory
+    root = (Path(__file__).parent.parent / "example_site").resolve()
+
     def translate_path(self, path):
-        # Serve files from the example_site directory
-        root = Path(__file__).parent.parent / "example_site"
-        return str(root / path.lstrip("/"))
+        return str(self.root / path.lstrip("/"))
 
 @pytest.fixture(scope="module")
 def test_server() -> Generator[str, None, None]:
-    PORT = 8000
     handler = CustomHTTPRequestHandler
-    httpd = socketserver.TCPServer(("", PORT), handler)
+    httpd = http.server.ThreadingHTTPServer(("", PORT), handler)
 
     def serve():
         with httpd:
@@ -41,9 +51,49 @@ def test_server() -> Generator[str, None, None]:
     httpd.shutdown()
     server_thread.join()
 
+@pytest.fixture(scope="session")
+def site_cache() -> Dict[str, bytes]:
+    # example_site contents keyed by URL path, read once per session
+    root = CustomHTTPRequestHandler.root
+    cache = {"/" + path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+    if "/index.html" in cache:
+        cache["/"] = cache["/index.html"]
+    return cache
+
+def route_site(context: BrowserContext, site_cache: Dict[str, bytes]) -> None:
+    # Serve static example_site files from memory; anything else still hits test_server
+    def handle(route: Route) -> None:
+        path = urlparse(route.request.url).path
+        body = site_cache.get(path)
+        if route.request.method != "GET" or body is None:
+            route.fallback()
+            return
+        content_type = mimetypes.guess_type(path)[0] or "text/html"
+        route.fulfill(status=200, body=body, content_type=content_type)
+
+    context.route(f"http://localhost:{PORT}/**", handle)
+
+@pytest.fixture(scope="session")
+def shared_context(browser: Browser, site_cache: Dict[str, bytes]) -> Generator[BrowserContext, None, None]:
+    context = browser.new_context()
+    route_site(context, site_cache)
+    yield context
+    context.close()
+
 @pytest.fixture(scope="function")
-def page_context(browser: Browser) -> Generator[Page, None, None]:
+def page_context(shared_context: BrowserContext) -> Generator[Page, None, None]:
+    # Fresh page on the shared context; reset cookies/permissions instead of a new context
+    page = shared_context.new_page()
+    yield page
+    page.close()
+    shared_context.clear_cookies()
+    shared_context.clear_permissions()
+
+@pytest.fixture(scope="function")
+def isolated_page(browser: Browser, site_cache: Dict[str, bytes]) -> Generator[Page, None, None]:
+    # For tests that touch storage or permissions and need a context of their own
     context = browser.new_context()
+    route_site(context, site_cache)
     page = context.new_page()
     yield page
     page.close()
@@ -87,6 +137,20 @@ def test_wait_for_url_change_success(page_context: Page, test_server: str) -> No
     assert page_context.url == "http://localhost:8000/new"
     logger.info("test_wait_for_url_change_success passed.")
 
+def test_wait_for_url_change_predicate(page_context: Page, test_server: str) -> None:
+    page_context.goto(test_server)
+    start_url = page_context.url
+    page_context.click("#linkToExample")
+    wait_for_url_change(page_context, lambda url: url != start_url)
+    assert page_context.url == "http://localhost:8000/new"
+    logger.info("test_wait_for_url_change_predicate passed.")
+
+def test_wait_for_url_change_already_at_destination(page_context: Page, test_server: str) -> None:
+    page_context.goto(f"{test_server}/new")
+    wait_for_url_change(page_context, "http://localhost:8000/new", timeout=1000)
+    assert page_context.url == "http://localhost:8000/new"
+    logger.info("test_wait_for_url_change_already_at_destination passed.")
+
 def test_wait_for_url_change_timeout(page_context: Page, test_server: str) -> None:
     page_context.goto(test_server)
     try:
@@ -132,6 +196,21 @@ def test_send_keys_safely_success(page_context: Page, test_server: str) -> None:
     assert input_value == "Test Input"
     logger.info("test_send_keys_safely_success passed.")
 
+def test_send_keys_safely_fast(page_context: Page, test_server: str) -> None:
+    page_context.goto(test_server)
+    page_context.evaluate("""() => {
+        window.firedEvents = [];
+        const input = document.getElementById('textInput');
+        for (const type of ['input', 'change']) {
+            input.addEventListener(type, () => window.firedEvents.push(type));
+        }
+    }""")
+    send_keys_safely(page_context, "#textInput", "Test Input", fast=True)
+    input_value = page_context.input_value("#textInput")
+    assert input_value == "Test Input"
+    assert page_context.evaluate("window.firedEvents") == ["input", "change"]
+    logger.info("test_send_keys_safely_fast passed.")
+
 def test_send_keys_safely_stale_element(page_context: Page, test_server: str) -> None:
     page_context.goto(test_server)
     page_context.evaluate("document.body.innerHTML = '<input id=\"input\"/>'")
@@ -161,6 +240,13 @@ def test_wait_for_element_to_be_clickable_timeout(page_context: Page, test_serve
         wait_for_element_to_be_clickable(page_context, selector, timeout=1000)
     logger.info("test_wait_for_element_to_be_clickable_timeout passed.")
 
+def test_wait_for_element_to_be_clickable_disabled(page_context: Page, test_server: str) -> None:
+    page_context.goto(test_server)
+    page_context.evaluate("document.body.innerHTML = '<button id=\"btn\" disabled>Click me</button>'")
+    with pytest.raises(PlaywrightTimeoutError):
+        wait_for_element_to_be_clickable(page_context, "#btn", timeout=1000)
+    logger.info("test_wait_for_element_to_be_clickable_disabled passed.")
+
 def test_wait_for_element_to_be_clickable_stale(page_context: Page, test_server: str) -> None:
     page_context.goto(test_server)
     page_context.evaluate("document.body.innerHTML = '<button id=\"btn\">Click me</button>'")
@@ -171,4 +257,71 @@ def test_wait_for_element_to_be_clickable_stale(page_context: Page, test_server:
         page_context.wait_for_function("document.querySelector('#btn') !== null")
     except PlaywrightTimeoutError:
         pass
-    logger.info("test_wait_for_element_to_be_clickable_stale passed.")
\ No newline at end of file
+    logger.info("test_wait_for_element_to_be_clickable_stale passed.")
+
+# --- Tests for get many ---
+def test_get_many_success(page_context: Page, test_server: str) -> None:
+    page_context.goto(test_server)
+    values = get_many(page_context, [
+        ("#clickableElement", None),
+        ("#linkToExample", "href"),
+        ("#nonExistentElement", None),
+        ("#linkToExample", ""),
+    ])
+    assert values == [
+        get_element_text(page_context, "#clickableElement"),
+        get_element_attribute(page_context, "#linkToExample", "href"),
+        None,
+        None,
+    ]
+    assert values[:2] == ["Click Me", "http://localhost:8000/new"]
+    logger.info("test_get_many_success passed.")
+
+# --- Tests for scroll to bottom ---
+def test_scroll_to_bottom_across_navigation(page_context: Page, test_server: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    init_scripts = []
+    add_init_script = page_context.add_init_script
+    monkeypatch.setattr(page_context, "add_init_script", lambda script: init_scripts.append(script) or add_init_script(script))
+    for _ in range(2):
+        page_context.goto(test_server)
+        page_context.evaluate("document.body.style.height = '5000px'")
+        scroll_to_bottom(page_context)
+        assert page_context.evaluate("window.scrollY") > 0
+    assert len(init_scripts) == 1
+    logger.info("test_scroll_to_bottom_across_navigation passed.")
+
+# --- Tests for check element exist ---
+def test_check_element_exist_success(page_context: Page, test_server: str) -> None:
+    page_context.goto(test_server)
+    assert check_element_exist(page_context, "#clickableElement")
+    logger.info("test_check_element_exist_success passed.")
+
+def test_check_element_exist_missing(page_context: Page, test_server: str) -> None:
+    page_context.goto(test_server)
+    assert not check_element_exist(page_context, "#nonExistentElement")
+    assert not check_element_exist(page_context, "#overlay")
+    logger.info("test_check_element_exist_missing passed.")
+
+# --- Tests for async helpers ---
+def run_async(coro: Coroutine) -> Any:
+    # The sync fixtures leave their loop marked as running on this thread,
+    # so asyncio.run() needs a thread of its own
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+def test_async_helpers_smoke(test_server: str, browser_name: str, browser_type_launch_args: Dict) -> None:
+    async def scenario():
+        async with async_playwright() as playwright:
+            browser = await getattr(playwright, browser_name).launch(**browser_type_launch_args)
+            try:
+                page = await browser.new_page()
+                await page.goto(test_server)
+                element = await async_utils.wait_for_element(page, "#delayedElement", timeout=3000)
+                elements = await async_utils.wait_for_all(page, ["#clickableElement", "#linkToExample"], timeout=3000)
+                text = await async_utils.get_element_text(page, "#clickableElement")
+                return await element.inner_text(), len(elements), text
+            finally:
+                await browser.close()
+
+    assert run_async(scenario()) == ("Hello, World!", 2, "Click Me")
+    logger.info("test_async_helpers_smoke passed.")